@@ -7,8 +7,10 @@
 """
 
 from datetime import datetime
+import heapq
 import json
 import logging
+import re
 from typing import Any, Dict, List, Literal, Optional, Set, Union, overload
 from urllib.parse import urlparse
 import lxml
@@ -16,7 +18,7 @@
 import requests
 
 from newspaper.exceptions import ArticleException
-from newspaper.text import StopWords
+from newspaper.text import get_stopwords
 import newspaper.parsers as parsers
 from . import network
 from . import nlp
@@ -45,6 +47,33 @@
     "cert",
 ]
 
+# Sentinel for attributes missing on the article
+_missing = object()
+
+# Markers of bot protection pages and the protection they belong to.
+# Ordered by priority, the first marker found decides the protection.
+_protection_markers = [
+    ("cloudflare", "Cloudflare"),
+    ("/cdn-cgi/challenge-platform/h/b/orchestrate/chl_page", "Cloudflare"),
+    ("cloud-flare", "Cloudflare"),
+    ("CloudFront", "CloudFront"),
+    ("perimeterx", "PerimeterX"),
+]
+
+# Nodes marked by the pickles of older versions, both markers in one pass
+_legacy_markers_xpath = parsers.compile_xpath(
+    "//*[@__newspaper_top_node or @__newspaper_top_node_complemented]"
+)
+
+# Url paths of articles related heavily to media (gallery, video, etc)
+_media_url_re = re.compile(r"/(?:video|slide|gallery|powerpoint|fashion|glamour|cloth)")
+
+
+def _same_items(a: List[str], b: List[str]) -> bool:
+    """Whether both lists hold the same items, regardless of their order.
+    Lists of different length are rejected without sorting"""
+    return len(a) == len(b) and sorted(a) == sorted(b)
+
 
 class ArticleDownloadState:
     """Download state for the Article object."""
@@ -292,6 +321,14 @@ def __init__(
         self.doc: Optional[lxml.html.Element] = None
         self._clean_doc: Optional[lxml.html.Element] = None
 
+        # DOM parsed from `html` during download(), reused by parse()
+        self._html_doc: Optional[lxml.html.Element] = None
+
+        # Serialized `doc` and `_top_node_complemented` tree used for
+        # pickling, reset on every parse()
+        self._doc_html: Optional[bytes] = None
+        self._top_node_complemented_html: Optional[bytes] = None
+
     def build(self):
         """Build a lone article from a URL independent of the source (newspaper).
         Don't normally call this method b/c it's good to multithread articles
@@ -339,16 +376,11 @@ def _parse_scheme_http(self, url: Optional[str] = None):
         return html
 
     def _detect_protection(self, html):
-        if "cloudflare" in html:
-            return "Cloudflare"
-        if "/cdn-cgi/challenge-platform/h/b/orchestrate/chl_page" in html:
-            return "Cloudflare"
-        if "cloud-flare" in html:
-            return "Cloudflare"
-        if "CloudFront" in html:
-            return "CloudFront"
-        if "perimeterx" in html:
-            return "PerimeterX"
+        if not html:
+            return None
+        for marker, protection in _protection_markers:
+            if marker in html:
+                return protection
 
         return None
 
@@ -403,36 +435,42 @@ def download(
                     recursion_counter=recursion_counter + 1,
                 )
 
+        doc = None
         if not ignore_read_more and self.read_more_link:
             doc = parsers.fromstring(html)
-            for read_more_node in doc.xpath(self.read_more_link):
+            read_more_xpath = parsers.compile_xpath(self.read_more_link)
+            for read_more_node in read_more_xpath(doc):
                 # TODO: add check for onclick redirections. need some examples
-                if read_more_node.get("href"):
-                    new_url = read_more_node.get("href")
+                href = read_more_node.get("href")
+                if not href:
+                    continue
+                log.info(
+                    "After downloading %s, found read more link: %s",
+                    self.url,
+                    href,
+                )
+                new_url = urls.prepare_url(href, self.url)
+                html_ = self._parse_scheme_http(new_url)
+                if html_ is not None:
+                    html = html_
+                    doc = None
+                    self.url = new_url
                     log.info(
-                        "After downloading %s, found read more link: %s",
+                        "Downloaded read more link: %s and updated url to %s",
+                        new_url,
                         self.url,
+                    )
+                else:
+                    log.info(
+                        "Failed to download read more link: %s, leaving original"
+                        " content in place",
                         new_url,
                     )
-                    new_url = urls.prepare_url(new_url, self.url)
-                    html_ = self._parse_scheme_http(new_url)
-                    if html_ is not None:
-                        html = html_
-                        self.url = new_url
-                        log.info(
-                            "Downloaded read more link: %s and updated url to %s",
-                            new_url,
-                            self.url,
-                        )
-                    else:
-                        log.info(
-                            "Failed to download read more link: %s, leaving original"
-                            " content in place",
-                            new_url,
-                        )
-                    break
+                break
 
         self.html = html
+        # The read more lookup already parsed the html, no need to do it again
+        self._html_doc = doc
         if title is not None:
             self.title = title
 
@@ -450,7 +488,13 @@ def parse(self) -> "Article":
         """
         self.throw_if_not_downloaded_verbose()
 
-        self.doc = parsers.fromstring(self.html)
+        if self._html_doc is not None:
+            self.doc = self._html_doc
+            self._html_doc = None
+        else:
+            self.doc = parsers.fromstring(self.html)
+        self._doc_html = None
+        self._top_node_complemented_html = None
 
         if self.doc is None:
             # `parse` call failed, return nothing
@@ -532,10 +576,11 @@ def is_valid_body(self):
                 " if it's body is valid!"
             )
         meta_type = self.extractor.metadata_extractor.meta_data["type"]
-        wordcount = self.text.split(" ")
-        sentcount = self.text.split(".")
+        # Same as len(self.text.split(...)), without building the lists
+        wordcount = self.text.count(" ") + 1
+        sentcount = self.text.count(".") + 1
 
-        if meta_type == "article" and len(wordcount) > (self.config.min_word_count):
+        if meta_type == "article" and wordcount > (self.config.min_word_count):
             log.debug("%s verified for article and wc", self.url)
             return True
 
@@ -543,15 +588,15 @@ def is_valid_body(self):
             log.debug("%s caught for no media no text", self.url)
             return False
 
-        if self.title is None or len(self.title.split(" ")) < 2:
+        if self.title is None or " " not in self.title:
             log.debug("%s caught for bad title", self.url)
             return False
 
-        if len(wordcount) < self.config.min_word_count:
+        if wordcount < self.config.min_word_count:
             log.debug("%s caught for word cnt", self.url)
             return False
 
-        if len(sentcount) < self.config.min_sent_count:
+        if sentcount < self.config.min_sent_count:
             log.debug("%s caught for sent cnt", self.url)
             return False
 
@@ -566,19 +611,7 @@ def is_media_news(self):
         """If the article is related heavily to media:
         gallery, video, big pictures, etc
         """
-        safe_urls = [
-            "/video",
-            "/slide",
-            "/gallery",
-            "/powerpoint",
-            "/fashion",
-            "/glamour",
-            "/cloth",
-        ]
-        for s in safe_urls:
-            if s in self.url:
-                return True
-        return False
+        return _media_url_re.search(self.url) is not None
 
     def nlp(self):
         """Method expects `download()` and `parse()` to have been run.
@@ -586,19 +619,20 @@ def nlp(self):
         self.throw_if_not_downloaded_verbose()
         self.throw_if_not_parsed_verbose()
 
-        stopwords = StopWords(self.config.language)
+        stopwords = get_stopwords(self.config.language)
         keywords = nlp.keywords(self.text, stopwords, self.config.max_keywords)
         for k, v in nlp.keywords(
             self.title, stopwords, self.config.max_keywords
         ).items():
-            if k in keywords:
-                keywords[k] += v
-                keywords[k] /= 2
-            else:
-                keywords[k] = v
+            score = keywords.get(k)
+            keywords[k] = v if score is None else (score + v) / 2
 
-        keywords = sorted(list(keywords.items()), key=lambda x: x[1], reverse=True)
-        keywords = keywords[: self.config.max_keywords]
+        if self.config.max_keywords is None:
+            keywords = sorted(keywords.items(), key=lambda x: x[1], reverse=True)
+        else:
+            keywords = heapq.nlargest(
+                self.config.max_keywords, keywords.items(), key=lambda x: x[1]
+            )
 
         self.keywords = [x[0] for x in keywords]  # remove score
         self.keyword_scores = dict(keywords)
@@ -663,6 +697,7 @@ def html(self, value: str):
             self._html = value
         else:
             self._html = ""
+        self._html_doc = None
 
     @property
     def imgs(self) -> List[str]:
@@ -692,9 +727,9 @@ def clean_doc(self) -> lxml.html.HtmlElement:
         Returns:
             lxml.html.HtmlElement: The cleaned document.
         """
-        if self._clean_doc is None:
+        if self._clean_doc is None and self.doc is not None:
             document_cleaner = DocumentCleaner(self.config)
-            self._clean_doc = document_cleaner.clean(self._clean_doc)
+            self._clean_doc = document_cleaner.clean(parsers.clone_tree(self.doc))
         return self._clean_doc
 
     @property
@@ -722,9 +757,9 @@ def summary(self, value: str):
         self._summary = value[: self.config.max_summary] if value else ""
 
     def set_movies(self, movie_objects):
-        """Set the video urls from Video Objects"""
-        movie_urls = [o.src for o in movie_objects if o and o.src]
-        self.movies = movie_urls
+        """Set the video urls from Video Objects. Duplicate urls are
+        dropped, keeping the order of first occurrence"""
+        self.movies = list(dict.fromkeys(o.src for o in movie_objects if o and o.src))
 
     def throw_if_not_downloaded_verbose(self):
         """Parse ArticleDownloadState -> log readable status
@@ -771,7 +806,10 @@ def to_json(self, as_string: Optional[bool] = True) -> Union[str, Dict]:
         article_dict: Dict[str, Any] = {}
 
         for metadata in settings.article_json_fields:
-            value = getattr(self, metadata, getattr(self.config, metadata, None))
+            # only fall back to the configuration for fields the article lacks
+            value = getattr(self, metadata, _missing)
+            if value is _missing:
+                value = getattr(self.config, metadata, None)
             if isinstance(value, datetime):
                 article_dict[metadata] = value.isoformat()
             else:
@@ -783,24 +821,42 @@ def to_json(self, as_string: Optional[bool] = True) -> Union[str, Dict]:
 
     def __getstate__(self):
         """Return a pickable object for this article. This can be used for caching"""
-        state = self.__dict__.copy()
-        # drop non pickable attributes
-        if (
+        parsed_state = (
             self.download_state == ArticleDownloadState.SUCCESS
             and self.top_node is not None
-        ):
-            state["__parsed_state"] = True
-            self.top_node.set("__newspaper_top_node", "xxx")
-            self._top_node_complemented.set("__newspaper_top_node_complemented", "xxx")
-            state["_doc_html"] = parsers.node_to_string(self.doc)
-        else:
-            state["__parsed_state"] = False
+        )
+        if parsed_state:
+            # Serialize the trees only once, until the next parse()
+            if self._doc_html is None:
+                self._doc_html = parsers.node_to_bytes(self.doc)
+            if (
+                self._top_node_complemented is not None
+                and self._top_node_complemented_html is None
+            ):
+                # The complemented node is off-tree, pickle its own tree
+                self._top_node_complemented_html = parsers.node_to_bytes(
+                    self._top_node_complemented.getroottree().getroot()
+                )
+
+        state = self.__dict__.copy()
+        state["__parsed_state"] = parsed_state
+        if parsed_state:
+            # Nodes are restored from their child indexes in the tree, so no
+            # marker attributes have to be added to the DOM
+            state["_top_node_path"] = parsers.get_node_path(self.doc, self.top_node)
+            if self._top_node_complemented is not None:
+                state["_top_node_complemented_path"] = parsers.get_node_path(
+                    self._top_node_complemented.getroottree().getroot(),
+                    self._top_node_complemented,
+                )
 
+        # drop non pickable attributes
         state.pop("extractor", None)
         state.pop("top_node", None)
         state.pop("_top_node_complemented", None)
         state.pop("doc", None)
-        # state.pop("clean_doc", None)
+        state.pop("_html_doc", None)
+        state.pop("_clean_doc", None)
 
         return state
 
@@ -811,58 +867,103 @@ def __setstate__(self, state):
         self.top_node = None
         self._top_node_complemented = None
         self.doc = None
-        # self.clean_doc = None
+        self._html_doc = None
+        self._clean_doc = None
+        self._top_node_complemented_html = state.get("_top_node_complemented_html")
 
         if state["__parsed_state"]:
-            self.doc = parsers.fromstring(state["_doc_html"])
-            delattr(self, "_doc_html")
-            nodes = parsers.get_elements_by_attribs(
-                self.doc, attribs={"__newspaper_top_node": "xxx"}
-            )
-            if nodes:
-                self.top_node = nodes[0]
-            nodes = parsers.get_elements_by_attribs(
-                self.doc, attribs={"__newspaper_top_node_complemented": "xxx"}
-            )
-            if nodes:
-                self._top_node_complemented = nodes[0]
-        delattr(self, "__parsed_state")
+            doc_html = state["_doc_html"]
+            if isinstance(doc_html, bytes):
+                self.doc = parsers.node_from_bytes(doc_html)
+            else:
+                # Pickled by an older version, serialize again when needed
+                self._doc_html = None
+                self.doc = parsers.fromstring(doc_html)
+
+            if "_top_node_path" in state:
+                node = parsers.get_node_by_path(self.doc, state["_top_node_path"])
+                if node is not None:
+                    self.top_node = node
+                if "_top_node_complemented_path" in state:
+                    root = parsers.node_from_bytes(self._top_node_complemented_html)
+                    node = parsers.get_node_by_path(
+                        root, state["_top_node_complemented_path"]
+                    )
+                    if node is not None:
+                        self._top_node_complemented = node
+            else:
+                # Older versions marked the nodes with attributes. The
+                # first marked node wins, as before. The markers are removed,
+                # they have no use in the restored DOM
+                self._top_node_complemented_html = None
+                for node in _legacy_markers_xpath(self.doc):
+                    attrib = node.attrib
+                    if (
+                        attrib.pop("__newspaper_top_node", None) is not None
+                        and self.top_node is None
+                    ):
+                        self.top_node = node
+                    if (
+                        attrib.pop("__newspaper_top_node_complemented", None)
+                        is not None
+                        and self._top_node_complemented is None
+                    ):
+                        self._top_node_complemented = node
+        else:
+            self._doc_html = None
+            self._top_node_complemented_html = None
+
+        for key in [
+            "__parsed_state",
+            "_top_node_path",
+            "_top_node_complemented_path",
+        ]:
+            self.__dict__.pop(key, None)
 
     def __eq__(self, other):
         """Compare two Article objects. If they are the same, return True.
-        Otherwise, return False.
+        Otherwise, return False. Comparing to other types is left to
+        python (``article == None`` is False).
         Args:
             other (Any): Another object to compare to.
         Returns:
             bool: True if the objects are the same, False otherwise.
         """
+        if self is other:
+            return True
         if not isinstance(other, Article):
-            raise NotImplementedError("Can only compare to other Article objects")
-
-        criteria = [
-            self.url == other.url,
-            self.title == other.title,
-            self.text == other.text,
-            self.top_image == other.top_image,
-            sorted(self.movies) == sorted(other.movies),
-            sorted(self.authors) == sorted(other.authors),
-            sorted(self.keywords) == sorted(other.keywords),
-            sorted(self.images) == sorted(other.images),
-            self.publish_date == other.publish_date,
-        ]
-
-        return all(criteria)
+            return NotImplemented
+
+        # Cheapest comparisons first, the rest is skipped on the first mismatch
+        return (
+            self.url == other.url
+            and self.title == other.title
+            and self.publish_date == other.publish_date
+            and self.top_image == other.top_image
+            and self.text == other.text
+            and _same_items(self.movies, other.movies)
+            and _same_items(self.authors, other.authors)
+            and _same_items(self.keywords, other.keywords)
+            and _same_items(self.images, other.images)
+        )
+
+    def __hash__(self):
+        """Hash of the fields identifying the article: url, title and
+        publish date. Equal articles always have the same hash, but since
+        these fields can change (e.g. on ``parse()``), do not modify
+        articles while they are stored in a set or used as dict keys.
+        Returns:
+            int: the hash of the article
+        """
+        return hash((self.url, self.title, self.publish_date))
 
     def __str__(self):
         """Return a string representation of the article.
         Returns:
             str: A string representation of the article.
         """
-        repr_ = f"__Title__: {self.title}"
-
-        if len(self.text) > 100:
-            repr_ += f"\n\n {self.text[:50]} [...] {self.text[:-50]}"
-        else:
-            repr_ += f"\n\n {self.text}"
+        text = self.text
+        if len(text) > 100:
+            text = f"{text[:50]} [...] {text[-50:]}"
 
-        return repr_
+        return f"__Title__: {self.title}\n\n {text}"
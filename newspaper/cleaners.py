@@ -222,17 +222,18 @@ def clean_bad_tags(self, doc: HtmlElement) -> HtmlElement:
         Returns:
             HtmlElement: The cleaned HTML document.
         """
+        contains_article = parsers.compile_xpath(self.contains_article)
         # bad ids
         naughty_list = parsers.get_tags_regex(doc, attribs={"id": self.remove_nodes_re})
         for node in naughty_list:
-            if not node.xpath(self.contains_article):
+            if not contains_article(node):
                 parsers.remove(node)
         # class
         naughty_list = parsers.get_tags_regex(
             doc, attribs={"class": self.remove_nodes_re}
         )
         for node in naughty_list:
-            if not node.xpath(self.contains_article):
+            if not contains_article(node):
                 parsers.remove(node)
         # name
         naughty_list = parsers.get_tags_regex(
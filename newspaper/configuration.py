@@ -265,7 +265,7 @@ def language(self, value: str):
                 "Your input language must be a 2 char language code,                "
                 " for example: english-->en \n and german-->de"
             )
-        if value not in list(get_available_languages()):
+        if value not in get_available_languages():
             raise ValueError(
                 f"We do not currently support input language {value} yet"
                 "supported languages are: {get_available_languages()}"
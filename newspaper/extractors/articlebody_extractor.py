@@ -1,4 +1,3 @@
-import copy
 from functools import partial
 import re
 from statistics import mean
@@ -7,7 +6,7 @@
 from newspaper.configuration import Configuration
 import newspaper.extractors.defines as defines
 import newspaper.parsers as parsers
-from newspaper.text import StopWords
+from newspaper.text import StopWords, get_stopwords
 
 score_weights = {
     "bottom_negativescore_nodes": 0.25,
@@ -38,7 +37,7 @@ def parse(self, doc: lxml.html.Element):
         Args:
             doc (lxml.html.Element): _description_
         """
-        self.stopwords = StopWords(self.config.language)
+        self.stopwords = get_stopwords(self.config.language)
         self.top_node = self.calculate_best_node(doc)
         self.top_node_complemented = self.complement_with_siblings(self.top_node)
 
@@ -144,7 +143,6 @@ def compute_features(self, doc):
                 continue
 
             word_stats = self.stopwords.get_stopword_count(text_content)
-            high_link_density = parsers.is_highlink_density(node, self.config.language)
 
             children_word_stats = [
                 (get_stop_words(child), get_word_count(child))
@@ -160,12 +158,17 @@ def compute_features(self, doc):
             parsers.set_attribute(
                 node, "word_count", word_stats.word_count - children_word_stats[1]
             )
+            parsers.set_attribute(node, "node_level", parsers.get_level(node))
+
+            if word_stats.stop_word_count <= 2:
+                # Not a candidate anyway, skip the (expensive) link density check
+                continue
+
+            high_link_density = parsers.is_highlink_density(node, self.config.language)
             parsers.set_attribute(
                 node, "is_highlink_density", 1 if high_link_density else 0
             )
-            parsers.set_attribute(node, "node_level", parsers.get_level(node))
-
-            if word_stats.stop_word_count > 2 and not high_link_density:
+            if not high_link_density:
                 candidates.append(node)
 
         return candidates
@@ -313,7 +316,7 @@ def update_node_count(self, node, add_to_count):
         parsers.set_attribute(node, "gravityNodes", str(new_count))
 
     def add_siblings(self, top_node):
-        res_node = copy.deepcopy(top_node)
+        res_node = parsers.clone_tree(top_node)
         baseline_score = self.get_normalized_score(top_node)
         results = self.walk_siblings(top_node)
         for current_node in results:
@@ -340,7 +343,7 @@ def get_plausible_content(self, node, baseline_score, score_weight=0.3):
             and node.text
             and not parsers.is_highlink_density(node, self.config.language)
         ):
-            element = copy.deepcopy(node)
+            element = parsers.clone_tree(node)
             element.tail = ""
             return [element]
 
@@ -428,7 +431,7 @@ def add_same_level_candidates(self, node):
 
         for n in candidates:
             if n == node:
-                new_node.append(copy.deepcopy(node))
+                new_node.append(parsers.clone_tree(node))
                 continue
 
             # avoid adding nodes that do not resemble the top node
@@ -440,7 +443,7 @@ def add_same_level_candidates(self, node):
             if score > base_score * 0.3 and not parsers.is_highlink_density(
                 n, self.config.language
             ):
-                new_node.append(copy.deepcopy(n))
+                new_node.append(parsers.clone_tree(n))
                 continue
 
             # content_items = self.get_plausible_content(n, base_score)
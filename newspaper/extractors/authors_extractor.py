@@ -1,4 +1,3 @@
-from copy import deepcopy
 import re
 import lxml
 from typing import Any, List, Tuple, Union
@@ -121,7 +120,7 @@ def get_text_from_element(node: lxml.html.HtmlElement) -> str:
             if node.tag in ["script", "style", "time"]:
                 return ""
 
-            node = deepcopy(node)
+            node = parsers.clone_tree(node)
             for tag in ["script", "style", "time"]:
                 for el in node.xpath(f".//{tag}"):
                     el.getparent().remove(el)
@@ -8,7 +8,7 @@
 import requests
 from newspaper import urls
 import newspaper.parsers as parsers
-from newspaper.network import session
+from newspaper import network
 from newspaper.configuration import Configuration
 import newspaper.extractors.defines as defines
 from newspaper.urls import urljoin_if_valid
@@ -193,7 +193,7 @@ def clean_url(url):
         response = None
         while True:
             try:
-                response = session.get(
+                response = network.session.get(
                     url,
                     stream=True,
                     **requests_params,
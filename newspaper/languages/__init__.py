@@ -1,5 +1,6 @@
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import FrozenSet, Optional
 
 from newspaper import settings
 
@@ -303,11 +304,12 @@ def get_language_from_iso639_1(iso639_1: str) -> Optional[str]:
     return languages_dict.get(iso639_1)
 
 
-def get_available_languages():
-    """Returns a list of available languages and their 2 char input codes"""
+@lru_cache(maxsize=1)
+def get_available_languages() -> FrozenSet[str]:
+    """Returns the 2 char input codes of the available languages. The
+    stopwords directory is only scanned on the first call"""
     stopword_files = Path(settings.STOPWORDS_DIR).glob("stopwords-??.txt")
-    for file in stopword_files:
-        yield file.stem.split("-")[1]
+    return frozenset(file.stem.split("-")[1] for file in stopword_files)
 
 
 def valid_languages():
@@ -5,6 +5,7 @@
 from concurrent.futures import ThreadPoolExecutor
 from typing import List, Union
 import newspaper
+from newspaper import network
 from newspaper.article import Article
 from newspaper.source import Source
 
@@ -50,6 +51,7 @@ def get_item(item: Union[str, Article, Source]) -> Union[Article, Source]:
 
         return item
 
+    network.ensure_pool_maxsize(threads)
     with ThreadPoolExecutor(max_workers=threads) as tpe:
         results = tpe.map(get_item, news_list)
 
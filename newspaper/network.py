@@ -5,6 +5,7 @@
 from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, List, Optional, Tuple, Union
 import logging
+import re
 import requests
 
 from requests import RequestException
@@ -18,6 +19,13 @@
 log = logging.getLogger(__name__)
 
 FAIL_ENCODING = "ISO-8859-1"
+# Bytes versions of the patterns in requests.utils.get_encodings_from_content,
+# so the charset declared in the html is found without decoding the body
+_CHARSET_RES = (
+    re.compile(rb'<meta.*?charset=["\']*(.+?)["\'>]', flags=re.I),
+    re.compile(rb'<meta.*?content=["\']*;?charset=(.+?)["\'>]', flags=re.I),
+    re.compile(rb'^<\?xml.*?encoding=["\']*(.+?)["\'>]'),
+)
 
 
 def get_session() -> requests.Session:
@@ -55,6 +63,24 @@ def get_session() -> requests.Session:
 session = get_session()
 
 
+def ensure_pool_maxsize(maxsize: int) -> None:
+    """Makes sure the session keeps at least `maxsize` keep-alive connections
+    per host. With a smaller pool, connections of multithreaded downloads to the
+    same host are discarded after each request instead of being reused.
+    Works for both the requests and cloudscraper sessions (the cloudscraper
+    adapter is a subclass of HTTPAdapter).
+
+    Args:
+        maxsize (int): the number of threads that will share the session.
+    """
+    for adapter in session.adapters.values():
+        # pylint: disable=protected-access
+        if getattr(adapter, "_pool_maxsize", maxsize) < maxsize:
+            adapter.init_poolmanager(
+                adapter._pool_connections, maxsize, block=adapter._pool_block
+            )
+
+
 def reset_session() -> requests.Session:
     """
     Resets the session variable to a new requests.Session object. Destroys any
@@ -123,27 +149,64 @@ def has_get_ranges(url: str) -> bool:
     return False
 
 
+def _is_binary_headers(headers) -> bool:
+    """Do the response headers announce binary content?"""
+    if "Content-Type" in headers:
+        if headers["Content-Type"].startswith("application"):
+            if (
+                "json" not in headers["Content-Type"]
+                and "xml" not in headers["Content-Type"]
+            ):
+                return True
+        if headers["Content-Type"].startswith("image"):
+            return True
+        if headers["Content-Type"].startswith("video"):
+            return True
+        if headers["Content-Type"].startswith("audio"):
+            return True
+        if headers["Content-Type"].startswith("font"):
+            return True
+
+    if "Content-Disposition" in headers:
+        return True
+
+    return False
+
+
+def _is_binary_content(content: Union[str, bytes, None]) -> bool:
+    """Does the beginning of the response body look like binary data?"""
+    if content is None:
+        return False
+
+    if isinstance(content, bytes):
+        content = content.decode("utf-8", errors="replace")
+
+    content = content[:1000]
+
+    if len(content) == 0:
+        return False
+
+    if "<html" in content:
+        return False
+
+    chars = len(
+        [
+            char
+            for char in [ord(c) if isinstance(c, str) else c for c in content]
+            if 31 < char < 128 or char in [9, 10, 13]
+        ]
+    )
+    if chars / len(content) < 0.6:  # 40% of the content is binary
+        return True
+
+    return False
+
+
 def is_binary_url(url: str) -> bool:
     """Does this url point to a binary file?"""
     try:
         resp = session.head(url, timeout=3, allow_redirects=True)
-        if "Content-Type" in resp.headers:
-            if resp.headers["Content-Type"].startswith("application"):
-                if (
-                    "json" not in resp.headers["Content-Type"]
-                    and "xml" not in resp.headers["Content-Type"]
-                ):
-                    return True
-            if resp.headers["Content-Type"].startswith("image"):
-                return True
-            if resp.headers["Content-Type"].startswith("video"):
-                return True
-            if resp.headers["Content-Type"].startswith("audio"):
-                return True
-            if resp.headers["Content-Type"].startswith("font"):
-                return True
-
-        if "Content-Disposition" in resp.headers:
+        if _is_binary_headers(resp.headers):
             return True
 
         if not has_get_ranges(url):
@@ -164,31 +227,10 @@ def is_binary_url(url: str) -> bool:
                     )
             content = resp.content
 
-        if resp.status_code > 299 or content is None:
+        if resp.status_code > 299:
             return False  # We cannot test if we get an error
 
-        if isinstance(content, bytes):
-            content = content.decode("utf-8", errors="replace")
-
-        content = content[:1000]
-
-        if len(content) == 0:
-            return False
-
-        if "<html" in content:
-            return False
-
-        chars = len(
-            [
-                char
-                for char in [ord(c) if isinstance(c, str) else c for c in content]
-                if 31 < char < 128 or char in [9, 10, 13]
-            ]
-        )
-        if chars / len(content) < 0.6:  # 40% of the content is binary
-            return True
-
-        return False
+        return _is_binary_content(content)
 
     except RequestException as e:
         log.debug("is_binary_url() error. %s on URL: %s", e, url)
@@ -207,13 +249,44 @@ def do_request(url: str, config: Configuration) -> Response:
     """
     session.headers.update(config.requests_params["headers"])
 
-    if not config.allow_binary_content:
-        if is_binary_url(url):
-            raise ArticleBinaryDataException(f"Article is binary data: {url}")
+    if config.allow_binary_content:
+        return session.get(
+            url=url,
+            **config.requests_params,
+        )
 
+    # Binary content is detected on the response itself: the headers and
+    # the first chunk of the body are checked before the rest is downloaded.
+    # This avoids extra HEAD / probing requests for every url.
     response = session.get(
         url=url,
-        **config.requests_params,
+        **{**config.requests_params, "stream": True},
+    )
+    if _is_binary_headers(response.headers):
+        response.close()
+        raise ArticleBinaryDataException(f"Article is binary data: {url}")
+
+    if response._content_consumed:  # pylint: disable=protected-access
+        # The body was already read, e.g. by a session hook or by cloudscraper
+        # on challenge pages. iter_content would replay it from the start.
+        if response.status_code <= 299 and _is_binary_content(
+            response.content[:1000]
+        ):
+            raise ArticleBinaryDataException(f"Article is binary data: {url}")
+        return response
+
+    content = next(response.iter_content(1000), b"")
+    if response.status_code <= 299 and _is_binary_content(content):
+        response.close()
+        raise ArticleBinaryDataException(f"Article is binary data: {url}")
+    # Read the rest of the body, so the response behaves as a non-streamed one.
+    # The small chunk size is only needed for sniffing; the rest is drained
+    # in larger chunks to keep the number of read/decode calls low.
+    # requests has no public way to put back the chunk already read:
+    # response.content raises once iter_content was started, and peeking into
+    # response.raw would bypass the gzip/deflate decoding
+    response._content = content + b"".join(  # pylint: disable=protected-access
+        response.iter_content(10 * 1024)
     )
 
     return response
@@ -270,20 +343,30 @@ def get_html_status(
 
     response = do_request(url, config)
 
+    html = _get_html_from_response(response, config)
+    if isinstance(html, bytes):
+        html = parsers.get_unicode_html(html)
+
     if response.status_code != 200:
         log.warning(
             "get_html_status(): bad status code %s on URL: %s, html: %s",
             response.status_code,
             url,
-            response.text[:200],
+            html[:200],
         )
-    html = _get_html_from_response(response, config)
-    if isinstance(html, bytes):
-        html = parsers.get_unicode_html(html)
 
     return html, response.status_code, response.history
 
 
+def _get_encoding_from_content(content: bytes) -> Optional[str]:
+    """Returns the first charset declared in the html content, if any."""
+    for charset_re in _CHARSET_RES:
+        match = charset_re.search(content)
+        if match:
+            return match.group(1).decode("ascii", "replace")
+    return None
+
+
 def _get_html_from_response(response: Response, config: Configuration) -> str:
     """Extracts and decodes the HTML content from a response object.
     Converts the response content to a utf string and returns it.
@@ -303,12 +386,14 @@ def _get_html_from_response(response: Response, config: Configuration) -> str:
         # return response as a unicode string
         html = response.text
     else:
-        html = str(response.content, "utf-8", errors="replace")
+        # Look for a charset declared in the raw content, so that the body
+        # is only decoded once (response.text decodes on every access)
         if "charset" not in response.headers.get("content-type", ""):
-            encodings = requests.utils.get_encodings_from_content(response.text)
-            if len(encodings) > 0:
-                response.encoding = encodings[0]
-                html = response.text
+            encoding = _get_encoding_from_content(response.content)
+            if encoding:
+                response.encoding = encoding
+                return response.text or ""
+        html = str(response.content, "utf-8", errors="replace")
 
     return html or ""
 
@@ -332,6 +417,7 @@ def multithread_request(
             timeout,
             requests_timeout,
         )
+    ensure_pool_maxsize(config.number_threads)
     results: List[Optional[Response]] = []
     with ThreadPoolExecutor(max_workers=config.number_threads) as tpe:
         result_futures = [
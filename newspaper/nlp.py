@@ -9,12 +9,17 @@
 import re
 import math
 from collections import Counter
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from newspaper.text import StopWords
 
 from . import settings
 
+# Number of texts for which keywords / summaries are cached. Keys hold the
+# full text, so keep this modest
+NLP_CACHE_SIZE = 128
+
 
 def keywords(text: str, stopwords: StopWords, max_keywords: Optional[int] = None):
     """Get the top 10 keywords and their frequency scores ignores
@@ -31,9 +36,20 @@ def keywords(text: str, stopwords: StopWords, max_keywords: Optional[int] = None
     Returns:
         dict: The top 10 keywords and their frequency scores.
     """
-    tokenised_text = list(stopwords.tokenizer(text))
     if not text:
         return dict()
+
+    return dict(_keywords_scores(text, stopwords)[:max_keywords])
+
+
+@lru_cache(maxsize=NLP_CACHE_SIZE)
+def _keywords_scores(text: str, stopwords: StopWords) -> Tuple[Tuple[str, float], ...]:
+    """All keywords of the text with their scores, sorted by descending
+    score. The results are cached, since the same text is analysed by
+    both :any:`keywords` and :any:`summarize` (and duplicate titles /
+    articles are common in batch runs).
+    """
+    tokenised_text = list(stopwords.tokenizer(text))
     # of words before removing blacklist words
     num_words = len(tokenised_text) or 1
     tokenised_text = list(
@@ -42,10 +58,7 @@ def keywords(text: str, stopwords: StopWords, max_keywords: Optional[int] = None
 
     freq = Counter(tokenised_text)
 
-    keywords_ = freq.most_common(max_keywords)
-    keywords_dict = {k: v * 1.5 / num_words + 1 for k, v in keywords_}
-
-    return keywords_dict
+    return tuple((k, v * 1.5 / num_words + 1) for k, v in freq.most_common())
 
 
 def summarize(title: str, text: str, stopwords: StopWords, max_sents: int = 5):
@@ -67,6 +80,14 @@ def summarize(title: str, text: str, stopwords: StopWords, max_sents: int = 5):
     if not text or not title or max_sents <= 0:
         return []
 
+    return list(_summarize(title, text, stopwords, max_sents))
+
+
+@lru_cache(maxsize=NLP_CACHE_SIZE)
+def _summarize(
+    title: str, text: str, stopwords: StopWords, max_sents: int
+) -> Tuple[str, ...]:
+    """Cached implementation of :any:`summarize`"""
     summaries = []
     sentences = split_sentences(text)
     keys = keywords(text, stopwords, settings.SUMMARIZE_KEYWORD_COUNT)
@@ -78,7 +99,7 @@ def summarize(title: str, text: str, stopwords: StopWords, max_sents: int = 5):
     # Filter out the first max_sents relevant sentences
     summaries = ranks[:max_sents]
     summaries.sort(key=lambda x: x[0])  # Sort my sentence order in the text
-    return [summary[1] for summary in summaries]
+    return tuple(summary[1] for summary in summaries)
 
 
 def title_score(title_tokens, sentence_tokens, stopwords):
@@ -6,7 +6,6 @@
 Module provinding the OutputFormatter class, which converts the article top node
 to plain text, removing most boilerplate and other unwanted elements.
 """
-from copy import deepcopy
 import logging
 import re
 from statistics import mean, stdev
@@ -52,7 +51,7 @@ def get_formatted(
         if top_node is None:
             return (text, html)
 
-        node_cleaned = deepcopy(top_node)
+        node_cleaned = parsers.clone_tree(top_node)
 
         self._remove_negativescores_nodes(node_cleaned)
 
@@ -157,14 +156,14 @@ def _remove_empty_tags(self, top_node: lxml.html.HtmlElement):
             tag = el.tag
             if tag == "br":
                 continue
+
+            # get_text already collapses and trims whitespace
+            if parsers.get_text(el):
+                continue
             if len(parsers.get_elements_by_tagslist(el, ["object", "embed"])) > 0:
                 continue
 
-            txt = parsers.get_text(el)
-            txt = re.sub(r"[\s\t]+", "", txt)
-
-            if not txt:
-                parsers.remove(el)
+            parsers.remove(el)
 
     def _get_top_level_nodes(self, top_node: lxml.html.HtmlElement):
         """Returns a list of nodes that are of the top level"""
@@ -7,23 +7,62 @@
 import sys
 from unicodedata import category
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 import re
 import string
-from typing import Dict, List
-from nltk.tokenize import WhitespaceTokenizer
+from typing import Dict, FrozenSet, List
 
 from newspaper import settings
 
-punctuation_set = {
-    c for i in range(sys.maxunicode + 1) if category(c := chr(i)).startswith("P")
-}
-punctuation_set.update(string.punctuation)
-# remove characters used in contractions
+# characters used in contractions
 contraction_separators = set("-'`ʹʻʼʽʾʿˈˊ‘’‛′‵Ꞌꞌ")
-punctuation_set -= contraction_separators
-punctuation: str = "".join(list(punctuation_set))
-whitespace_tokenizer = WhitespaceTokenizer()
+_contraction_regex_str = re.escape("".join(contraction_separators))
+contraction_separators_re = re.compile(
+    rf"(?<=\W)[{_contraction_regex_str}]|[{_contraction_regex_str}](?=\W)|"
+    f"^[{_contraction_regex_str}]*|[{_contraction_regex_str}]*$|"
+    f"[{_contraction_regex_str}]{{2,}}"
+)
+
+
+@lru_cache(maxsize=1)
+def _punctuation_set() -> FrozenSet[str]:
+    """All unicode punctuation characters, except the contraction separators.
+    Built on first use, since it has to check every unicode code point
+    (a few hundred milliseconds)."""
+    punctuation_set = {
+        c for c in map(chr, range(sys.maxunicode + 1)) if category(c)[0] == "P"
+    }
+    punctuation_set.update(string.punctuation)
+    return frozenset(punctuation_set - contraction_separators)
+
+
+@lru_cache(maxsize=1)
+def _punctuation_table() -> Dict[int, int]:
+    """Translation table replacing punctuation with spaces"""
+    punctuation = "".join(_punctuation_set())
+    return str.maketrans(punctuation, " " * len(punctuation))
+
+
+@lru_cache(maxsize=1)
+def _whitespace_tokenizer():
+    # nltk is slow to import, only load it when tokenizing
+    from nltk.tokenize import (  # pylint: disable=import-outside-toplevel
+        WhitespaceTokenizer,
+    )
+
+    return WhitespaceTokenizer()
+
+
+def __getattr__(name):
+    # Module constants that are now built lazily
+    if name == "punctuation_set":
+        return set(_punctuation_set())
+    if name == "punctuation":
+        return "".join(_punctuation_set())
+    if name == "whitespace_tokenizer":
+        return _whitespace_tokenizer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def inner_trim(value):
@@ -63,21 +102,10 @@ def default_tokenizer(text):
     if isinstance(text, bytes):
         text = text.decode("utf-8", "replace")
     # Remove punctuation
-    text = text.translate(
-        str.maketrans(
-            punctuation,
-            " " * len(punctuation),
-        )
-    )
+    text = text.translate(_punctuation_table())
     # remove multiple contraction separators
-    regex_str = re.escape("".join(contraction_separators))
-    text = re.sub(
-        rf"(?<=\W)[{regex_str}]|[{regex_str}](?=\W)|"
-        f"^[{regex_str}]*|[{regex_str}]*$|[{regex_str}]{{2,}}",
-        " ",
-        text,
-    )
-    return whitespace_tokenizer.tokenize(text.lower())
+    text = contraction_separators_re.sub(" ", text)
+    return _whitespace_tokenizer().tokenize(text.lower())
 
 
 @dataclass
@@ -172,3 +200,19 @@ def get_stopword_count(self, content: str) -> WordStats:
             word_count=len(tokens),
             stop_words=intersection,
         )
+
+
+@lru_cache(maxsize=None)
+def get_stopwords(language: str = "en") -> StopWords:
+    """Returns the :any:`StopWords` object for the language. The object is
+    created only once per language and then shared, so it must be treated
+    as read-only.
+
+    Args:
+        language (str): The language code for the stop words.
+            Defaults to "en" (English).
+
+    Returns:
+        StopWords: the stopwords object for the language
+    """
+    return StopWords(language)
@@ -9,6 +9,7 @@
 
 import logging
 import random
+import re
 import sys
 import time
 
@@ -27,6 +28,10 @@
 
 cache_disk = CacheDiskDecorator(enabled=True)
 
+# Cheap check for a possible meta refresh tag, so that only pages that
+# might have one are parsed with BeautifulSoup
+_meta_refresh_re = re.compile(r"http-equiv\s*=\s*[\"']?refresh", re.IGNORECASE)
+
 
 def domain_to_filename(domain: str) -> str:
     """Creates the filename for the Domain cache file"""
@@ -47,6 +52,8 @@ def extract_meta_refresh(html):
         ct=ga&cd=CAAYATIaYTc4ZTgzYjAwOTAwY2M4Yjpjb206ZW46VVM&
         usg=AFQjCNF7zAl6JPuEsV4PbEzBomJTUpX4Lg
     """
+    if not html or not _meta_refresh_re.search(html):
+        return None
     soup = BeautifulSoup(html, "html.parser")
     element = soup.find("meta", attrs={"http-equiv": "refresh"})
     if element:
@@ -7,9 +7,10 @@
 import pytest
 from dateutil.parser import parse as date_parser
 import newspaper
-from newspaper import urls
+from newspaper import parsers, urls
 from newspaper.article import Article, ArticleDownloadState, ArticleException
 from newspaper.configuration import Configuration
+from newspaper.utils import Video
 import tests.conftest as conftest
 
 
@@ -193,6 +194,21 @@ def test_article_nlp(self, cnn_article):
         assert sorted(article.keywords) == sorted(cnn_article["keywords"])
         assert article.summary.strip() == cnn_article["summary"].strip()
 
+    def test_article_nlp_all_keywords(self, cnn_article):
+        article = newspaper.Article(
+            cnn_article["url"], fetch_images=False, max_summary_sent=0
+        )
+        article.download(input_html=cnn_article["html_content"])
+        article.parse()
+        article.nlp()
+        top_keywords = article.keywords
+
+        article.config.max_keywords = None
+        article.nlp()
+        assert len(article.keywords) > len(top_keywords)
+        scores = list(article.keyword_scores.values())
+        assert scores == sorted(scores, reverse=True)
+
     def test_download_inexisting_file(self):
         url = "file://" + str(
             Path(__file__).resolve().parent / "data/html/does_not_exist.html"
@@ -221,6 +237,37 @@ def test_get_video_links(self, article_video_fixture):
 
             assert sorted(article.movies) == sorted(test_case["movies"])
 
+    def test_set_movies_deduplicates(self):
+        article = Article(url="www.test.com")
+        article.set_movies(
+            [
+                Video(src="https://youtube.com/embed/a"),
+                None,
+                Video(src="https://youtube.com/embed/b"),
+                Video(src=None),
+                Video(src="https://youtube.com/embed/a"),
+            ]
+        )
+        assert article.movies == [
+            "https://youtube.com/embed/a",
+            "https://youtube.com/embed/b",
+        ]
+
+    def test_compare_to_other_types(self):
+        article = Article(url="www.test.com")
+        assert article != None  # noqa: E711
+        assert article != "www.test.com"
+        assert article not in [None, 1, "www.test.com"]
+
+    def test_str(self):
+        article = Article(url="www.test.com")
+        article.title = "Title"
+        article.text = "a" * 60 + "b" * 60
+        assert str(article) == f"__Title__: Title\n\n {'a' * 50} [...] {'b' * 50}"
+
+        article.text = "short text"
+        assert str(article) == "__Title__: Title\n\n short text"
+
     def test_get_top_image(self, top_image_fixture):
         for test_case in top_image_fixture:
             article = Article(url=test_case["url"], fetch_images=False)
@@ -322,3 +369,69 @@ def test_pickle(self, cnn_article):
 
         article_ = pickle.load(bytes_io)
         assert article == article_
+        assert article_.top_node is not None
+        assert article_.doc.getroottree().getpath(
+            article_.top_node
+        ) == article.doc.getroottree().getpath(article.top_node)
+        assert article_._top_node_complemented is not None
+        # pickling must not alter the original DOM
+        assert article.top_node.get("__newspaper_top_node") is None
+
+        article__ = pickle.loads(pickle.dumps(article_))
+        assert article == article__
+        assert hash(article) == hash(article__)
+        assert len({article, article_, article__}) == 1
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            # top node under a prefixed tag, not usable in an xpath
+            "<html><body><ui:layout><div><p>{text}</p></div></ui:layout>"
+            "</body></html>",
+            # fragment without <html> / <body>
+            "<h1>Title</h1><div><p>{text}</p></div><div><p>Other</p></div>",
+        ],
+    )
+    def test_pickle_top_node_path(self, html):
+        text = "This is a sentence of the article with some words. " * 30
+        article = newspaper.article(
+            "http://example.com/article",
+            input_html=html.format(text=text),
+            fetch_images=False,
+        )
+        assert article.top_node is not None
+
+        article_ = pickle.loads(pickle.dumps(article))
+        assert article_.top_node is not None
+        assert article_.top_node.tag == article.top_node.tag
+        assert article_.top_node.text_content() == article.top_node.text_content()
+        assert article_._top_node_complemented is not None
+
+    def test_unpickle_legacy_markers(self, cnn_article):
+        article = newspaper.article(
+            cnn_article["url"],
+            input_html=cnn_article["html_content"],
+            fetch_images=False,
+        )
+        top_node_path = article.doc.getroottree().getpath(article.top_node)
+        # Older versions pickled the DOM as str, with the nodes marked
+        doc = parsers.fromstring(parsers.node_to_string(article.doc))
+        doc.xpath(top_node_path)[0].set("__newspaper_top_node", "xxx")
+        doc.xpath("//p")[0].set("__newspaper_top_node_complemented", "xxx")
+        state = article.__getstate__()
+        for key in [
+            "_top_node_path",
+            "_top_node_complemented_html",
+            "_top_node_complemented_path",
+        ]:
+            state.pop(key)
+        state["_doc_html"] = parsers.node_to_string(doc)
+
+        article_ = Article.__new__(Article)
+        article_.__setstate__(state)
+        assert article == article_
+        assert article_.doc.getroottree().getpath(article_.top_node) == top_node_path
+        assert article_._top_node_complemented.tag == "p"
+        assert not article_.doc.xpath(
+            "//*[@__newspaper_top_node or @__newspaper_top_node_complemented]"
+        )
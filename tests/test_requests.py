@@ -1,7 +1,70 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import gzip
+import threading
 import pytest
 import os
 import newspaper.network as network
 from newspaper import article, ArticleException
+from newspaper.configuration import Configuration
+
+LOCAL_HTML = b"<html><body><p>Hello local server</p></body></html>"
+# Binary data served without any binary Content-Type / Content-Disposition
+LOCAL_BINARY = bytes(range(256)) * 8
+# Charset declared only in the html, not in the Content-Type header
+LOCAL_META_CHARSET_HTML = (
+    '<html><head><meta charset="windows-1251"></head>'
+    "<body><p>Привет, мир</p></body></html>"
+)
+# Charset declared after a long inline script
+LOCAL_LATE_META_CHARSET_HTML = (
+    "<html><head><script>"
+    + "var x = 1;\n" * 500
+    + '</script><meta charset="windows-1251"></head>'
+    "<body><p>Привет, мир</p></body></html>"
+)
+# Large body, so the download is read in many chunks after the sniffed one
+LOCAL_LARGE_HTML = (
+    "<html><body>"
+    + "".join(f"<p>Paragraph {i}: ünïcödé text</p>" for i in range(100000))
+    + "</body></html>"
+)
+
+
+class LocalHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        content_type = "text/html; charset=utf-8"
+        if self.path == "/binary":
+            body = LOCAL_BINARY
+        elif self.path == "/large-gzip":
+            body = gzip.compress(LOCAL_LARGE_HTML.encode("utf-8"))
+        elif self.path == "/meta-charset":
+            body = LOCAL_META_CHARSET_HTML.encode("windows-1251")
+            content_type = "text/html"
+        elif self.path == "/late-meta-charset":
+            body = LOCAL_LATE_META_CHARSET_HTML.encode("windows-1251")
+            content_type = "text/html"
+        else:
+            body = LOCAL_HTML
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        if self.path == "/large-gzip":
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LocalHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
 
 
 @pytest.fixture
@@ -42,3 +105,53 @@ def test_detect_binary(self, binary_url):
 
         url = "https://aol.com"  # does not have Ranges
         assert not network.has_get_ranges(url), "detect range requests failed"
+
+    def test_get_html_local(self, local_server):
+        html, status_code, _ = network.get_html_status(
+            f"{local_server}/article", Configuration()
+        )
+        assert status_code == 200
+        assert html == LOCAL_HTML.decode("utf-8")
+
+    def test_large_gzip_body_local(self, local_server):
+        response = network.do_request(f"{local_server}/large-gzip", Configuration())
+        assert response.status_code == 200
+        assert response.content == LOCAL_LARGE_HTML.encode("utf-8")
+        assert response.text == LOCAL_LARGE_HTML
+
+    def test_get_html_meta_charset_local(self, local_server):
+        html = network.get_html(f"{local_server}/meta-charset")
+        assert html == LOCAL_META_CHARSET_HTML
+
+    def test_get_html_late_meta_charset_local(self, local_server):
+        html = network.get_html(f"{local_server}/late-meta-charset")
+        assert html == LOCAL_LATE_META_CHARSET_HTML
+
+    def test_body_read_by_hook_local(self, local_server):
+        def read_body(response, *args, **kwargs):
+            _ = response.text
+
+        network.session.hooks["response"].append(read_body)
+        try:
+            response = network.do_request(
+                f"{local_server}/large-gzip", Configuration()
+            )
+        finally:
+            network.session.hooks["response"].remove(read_body)
+        assert response.content == LOCAL_LARGE_HTML.encode("utf-8")
+
+    def test_detect_binary_content_local(self, local_server):
+        with pytest.raises(network.ArticleBinaryDataException):
+            network.get_html(f"{local_server}/binary")
+
+    def test_allow_binary_content_local(self, local_server):
+        config = Configuration()
+        config.allow_binary_content = True
+        response = network.do_request(f"{local_server}/binary", config)
+        assert response.status_code == 200
+        assert response.content == LOCAL_BINARY
+
+    def test_ensure_pool_maxsize(self):
+        network.ensure_pool_maxsize(25)
+        for adapter in network.session.adapters.values():
+            assert adapter.poolmanager.connection_pool_kw["maxsize"] >= 25